@@ -15,8 +15,6 @@ else:
 if TYPE_CHECKING:
     from typing_extensions import NotRequired, Self
 
-import tomlkit
-
 from .. import argv0, is_env_var_truthy, log
 from ..ruyipkg.repo import MetadataRepo
 from ..telemetry import TelemetryStore
@@ -327,7 +325,7 @@ class GlobalConfig:
         from lowest to highest (so that each file may be simply applied consecutively).
         """
 
-        for config_dir in reversed(list(self._dirs.app_config_dirs)):
+        for config_dir in reversed(self._dirs.app_config_dirs):
             yield config_dir / "config.toml"
 
     @property
@@ -337,7 +335,7 @@ class GlobalConfig:
     def try_apply_config_file(self, path: os.PathLike[Any]) -> None:
         try:
             with open(path, "rb") as fp:
-                data: Any = tomlkit.load(fp)
+                data: Any = tomllib.load(fp)
         except FileNotFoundError:
             return
 
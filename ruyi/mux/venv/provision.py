@@ -9,7 +9,7 @@ import shutil
 from typing import Any, Final, Callable, Iterator, Tuple, TypedDict
 import zlib
 
-from jinja2 import BaseLoader, Environment, TemplateNotFound
+from jinja2 import BaseLoader, Environment, Template, TemplateNotFound
 
 from ... import log, self_exe
 from ...ruyipkg.pkg_manifest import EmulatorProgDecl
@@ -47,8 +47,16 @@ JINJA_ENV: Final = Environment(
 JINJA_ENV.filters["sh"] = shlex.quote
 
 
+# the templates are statically embedded and never change, so the compiled
+# templates can be kept around without going through Jinja's cache checks
+_TEMPLATE_CACHE: Final[dict[str, Template]] = {}
+
+
 def render_template_str(template_name: str, data: dict[str, Any]) -> str:
-    tmpl = JINJA_ENV.get_template(template_name)
+    tmpl = _TEMPLATE_CACHE.get(template_name)
+    if tmpl is None:
+        tmpl = JINJA_ENV.get_template(template_name)
+        _TEMPLATE_CACHE[template_name] = tmpl
     return tmpl.render(data)
 
 
@@ -6,7 +6,6 @@ from rich.table import Table
 from .. import is_porcelain, log
 from ..cli.cmd import RootCommand
 from ..config import GlobalConfig
-from ..utils.markdown import RuyiStyledMarkdown
 from ..utils.porcelain import PorcelainOutput
 from .news import NewsItem, NewsItemContent, NewsItemStore
 
@@ -156,6 +155,10 @@ def filter_news_items_by_specs(
 
 
 def print_news(nic: NewsItemContent) -> None:
+    # rich.markdown pulls in pygments via rich.syntax, which is costly to
+    # import and only needed when actually rendering news
+    from ..utils.markdown import RuyiStyledMarkdown
+
     md = RuyiStyledMarkdown(nic.content)
     log.stdout(md)
     log.stdout("")
@@ -1,3 +1,4 @@
+import functools
 import glob
 import os
 import platform
@@ -38,7 +39,16 @@ class RISCVMachineInfo(TypedDict):
     mmu: str
 
 
+# the libc of the running process cannot change underneath us
+@functools.cache
 def probe_for_libc() -> tuple[str, str]:
+    # ask glibc directly first, because platform.libc_ver() works by scanning
+    # sys.executable for version markers, which can be slow for a packaged
+    # ruyi binary
+    if sys.platform == "linux":
+        if ver := _try_get_glibc_ver():
+            return ("glibc", ver)
+
     r = platform.libc_ver()
     if r[0] and r[1]:
         return r
@@ -59,16 +69,46 @@ def probe_for_libc() -> tuple[str, str]:
     return ("unknown", "unknown")
 
 
+def _try_get_glibc_ver() -> str | None:
+    import ctypes
+
+    try:
+        fn = ctypes.CDLL(None).gnu_get_libc_version
+    except (AttributeError, OSError):
+        # not glibc
+        return None
+
+    fn.restype = ctypes.c_char_p
+    ver: bytes | None = fn()
+    return ver.decode("ascii", "ignore") if ver else None
+
+
 _MUSL_VERSION_RE: Final = re.compile(rb"(?m)^Version ([0-9.]+)$")
+_MUSL_LDSO_TARGET_VERSION_RE: Final = re.compile(r"-([0-9]+(?:\.[0-9]+)+)\.so")
 
 
 def _try_get_musl_ver(ldso_path: str) -> str | None:
+    # some distributions ship the ld.so as a symlink to a versioned libc,
+    # e.g. libc-1.2.5.so, in which case we can avoid spawning a process
+    try:
+        target = os.readlink(ldso_path)
+    except OSError:
+        pass
+    else:
+        basename = os.path.basename(target)
+        if tm := _MUSL_LDSO_TARGET_VERSION_RE.search(basename):
+            return tm.group(1)
+
     res = subprocess.run([ldso_path], stderr=subprocess.PIPE)
     if m := _MUSL_VERSION_RE.search(res.stderr):
         return m.group(1).decode("ascii", "ignore")
     return None
 
 
+# "key: value" lines, split at the first ": "; lines without one are skipped
+_CPUINFO_LINE_RE: Final = re.compile(r"(?m)^(.*?): (.*)$")
+
+
 def _try_parse_hex(v: str) -> int | None:
     if not v.startswith("0x"):
         return None
@@ -109,18 +149,9 @@ def probe_for_riscv_machine_info(
     marchid: int | None = None
     mimpid: int | None = None
     if cpuinfo_data is not None:
-        for line in cpuinfo_data.split("\n"):
-            if not line:
-                continue
-
-            try:
-                k, v = line.split(": ", 1)
-            except ValueError:
-                # malformed line: non-empty but no ": "
-                continue
-
-            k = k.strip(" \t")
-            v = v.strip()
+        for m in _CPUINFO_LINE_RE.finditer(cpuinfo_data):
+            k = m.group(1).strip(" \t")
+            v = m.group(2).strip()
 
             match k:
                 case "processor":
@@ -1,6 +1,8 @@
+from collections.abc import Iterable, Set
+import functools
 import locale
 
-from typing import Iterable, NamedTuple
+from typing import NamedTuple
 
 
 class LangAndRegion(NamedTuple):
@@ -9,6 +11,7 @@ class LangAndRegion(NamedTuple):
     region: str | None
 
 
+@functools.lru_cache(maxsize=64)
 def lang_code_to_lang_region(lang_code: str, guess_region: bool) -> LangAndRegion:
     if not guess_region and "_" not in lang_code:
         return LangAndRegion(lang_code, lang_code, None)
@@ -27,17 +30,29 @@ def match_lang_code(
     """Returns a proper available language code based on a list of available
     language codes, and a request."""
 
-    if not isinstance(avail, set) or not isinstance(avail, frozenset):
-        avail = set(avail)
+    avail_set: Set[str]
+    if isinstance(avail, (set, frozenset)):
+        avail_set = avail
+    else:
+        avail_set = frozenset(avail)
 
     # return the only one choice if this is the case
-    if len(avail) == 1:
-        return next(iter(avail))
+    if len(avail_set) == 1:
+        return next(iter(avail_set))
 
     # try exact match
-    if req in avail:
+    if req in avail_set:
         return req
 
+    # frozenset() of a frozenset is a no-op, so only plain sets get copied
+    # here, and only when the fast paths above did not apply
+    return _match_lang_code_cached(req, frozenset(avail_set))
+
+
+# the result only depends on the request and the set of available language
+# codes, both of which are typically static within a single run
+@functools.lru_cache(maxsize=128)
+def _match_lang_code_cached(req: str, avail: frozenset[str]) -> str:
     return _match_lang_code_slowpath(
         lang_code_to_lang_region(req, True),
         [lang_code_to_lang_region(x, False) for x in avail],
@@ -1,23 +1,35 @@
+import inspect
+
 from rich.console import Console, ConsoleOptions, RenderResult
 from rich.markdown import CodeBlock, Heading, Markdown, MarkdownContext
 from rich.syntax import Syntax
 from rich.text import Text
 
+# "# " through "###### ", indexed by (heading level - 1)
+_HEADING_PREFIXES = tuple("#" * i + " " for i in range(1, 7))
+
+
+# the heading level is indicated in the tag name in rich >= 13.2.0,
+# e.g. self.tag == 'h1', but directly stored in earlier versions
+# as self.level. Probe for this once instead of on every heading.
+#
+# see https://github.com/Textualize/rich/commit/a20c3d5468d02a55
+if "tag" in inspect.signature(Heading.__init__).parameters:
+
+    def _get_heading_level(h: Heading) -> int:
+        return int(h.tag[1:])  # type: ignore[attr-defined,unused-ignore]
+
+else:
+
+    def _get_heading_level(h: Heading) -> int:
+        return h.level  # type: ignore[attr-defined,no-any-return,unused-ignore]
+
 
 class SlimHeading(Heading):
     def on_enter(self, context: MarkdownContext) -> None:
-        try:
-            # the heading level is indicated in the tag name in rich >= 13.2.0,
-            # e.g. self.tag == 'h1', but directly stored in earlier versions
-            # as self.level.
-            #
-            # see https://github.com/Textualize/rich/commit/a20c3d5468d02a55
-            heading_level = int(self.tag[1:])  # type: ignore[attr-defined,unused-ignore]
-        except AttributeError:
-            heading_level = self.level  # type: ignore[attr-defined,unused-ignore]
-
+        heading_level = _get_heading_level(self)
         context.enter_style(self.style_name)
-        self.text = Text("#" * heading_level + " ", context.current_style)
+        self.text = Text(_HEADING_PREFIXES[heading_level - 1], context.current_style)
 
     def __rich_console__(
         self,
@@ -3,7 +3,7 @@ import enum
 import json
 import sys
 from types import TracebackType
-from typing import BinaryIO, TypedDict, TYPE_CHECKING
+from typing import BinaryIO, Final, TypedDict, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -23,15 +23,32 @@ else:
         PkgListOutputV1 = "pkglistoutput-v1"
 
 
+# reused across emit() calls to avoid re-instantiating an encoder every time
+_json_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
 class PorcelainEntity(TypedDict):
     ty: PorcelainEntityType
 
 
+# size of the internal buffer above which batched entities are written out
+PORCELAIN_BATCH_THRESHOLD: Final = 64 * 1024
+
+
 class PorcelainOutput(AbstractContextManager["PorcelainOutput"]):
+    """Emitter of porcelain entities in the JSON Lines format.
+
+    Entities emitted while inside the context are batched in an internal
+    buffer, and written out to the underlying stream in larger chunks. They
+    are written immediately if emitted outside of a context."""
+
     def __init__(self, out: BinaryIO | None = None) -> None:
         self.out = sys.stdout.buffer if out is None else out
+        self._buf = bytearray()
+        self._is_batching = False
 
     def __enter__(self) -> "Self":
+        self._is_batching = True
         return self
 
     def __exit__(
@@ -40,10 +57,24 @@ class PorcelainOutput(AbstractContextManager["PorcelainOutput"]):
         exc_value: BaseException | None,
         traceback: TracebackType | None,
     ) -> bool | None:
-        self.out.flush()
+        self._is_batching = False
+        self.flush()
         return None
 
+    def flush(self) -> None:
+        if self._buf:
+            self.out.write(self._buf)
+            self._buf.clear()
+        self.out.flush()
+
     def emit(self, obj: PorcelainEntity) -> None:
-        s = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
-        self.out.write(s.encode("utf-8"))
-        self.out.write(b"\n")
+        data = _json_encode(obj).encode("utf-8")
+        if not self._is_batching:
+            self.out.write(data + b"\n")
+            return
+
+        self._buf += data
+        self._buf += b"\n"
+        if len(self._buf) >= PORCELAIN_BATCH_THRESHOLD:
+            self.out.write(self._buf)
+            self._buf.clear()
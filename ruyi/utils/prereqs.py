@@ -1,6 +1,6 @@
 import shutil
 import sys
-from typing import Final, NoReturn
+from typing import Final, Iterable, NoReturn
 
 from ruyi import log
 
@@ -9,38 +9,24 @@ def has_cmd_in_path(cmd: str) -> bool:
     return shutil.which(cmd) is not None
 
 
-_CMDS: Final = (
-    "bzip2",
-    "gunzip",
-    "lz4",
-    "tar",
-    "xz",
-    "zstd",
-    "unzip",
-    # commands used by the device provisioner
-    "sudo",
-    "dd",
-    "fastboot",
-)
-
 _CMD_PRESENCE_MAP: Final[dict[str, bool]] = {}
 
 
-def init_cmd_presence_map() -> None:
-    for cmd in _CMDS:
+def _update_cmd_presence_map(cmds: Iterable[str]) -> None:
+    # the names are expected to be interned by the caller already
+    for cmd in cmds:
         _CMD_PRESENCE_MAP[cmd] = has_cmd_in_path(cmd)
 
 
 def ensure_cmds(*cmds: str) -> None | NoReturn:
-    if not _CMD_PRESENCE_MAP:
-        init_cmd_presence_map()
+    # the command names may be dynamically constructed, intern them so that
+    # the presence map lookups below can be satisfied by identity comparison
+    requested = {sys.intern(cmd) for cmd in cmds}
 
-    # in case any command's availability is not cached in advance
-    for cmd in cmds:
-        if cmd not in _CMD_PRESENCE_MAP:
-            _CMD_PRESENCE_MAP[cmd] = has_cmd_in_path(cmd)
+    # only look up the commands actually requested, and only once per process
+    _update_cmd_presence_map(requested - _CMD_PRESENCE_MAP.keys())
 
-    absent_cmds = sorted(cmd for cmd in cmds if not _CMD_PRESENCE_MAP.get(cmd, False))
+    absent_cmds = sorted(cmd for cmd in requested if not _CMD_PRESENCE_MAP[cmd])
     if not absent_cmds:
         return None
 
@@ -6,7 +6,7 @@ from typing import Final, NamedTuple
 
 import certifi
 
-from .. import log
+from .. import is_debug, log
 
 _orig_get_default_verify_paths: Final = ssl.get_default_verify_paths
 _cached_paths: ssl.DefaultVerifyPaths | None = None
@@ -21,9 +21,8 @@ def get_system_ssl_default_verify_paths() -> ssl.DefaultVerifyPaths:
 
 
 def _get_system_ssl_default_verify_paths() -> ssl.DefaultVerifyPaths:
-    orig_paths = _orig_get_default_verify_paths()
     if sys.platform != "linux":
-        return orig_paths
+        return _orig_get_default_verify_paths()
 
     result: ssl.DefaultVerifyPaths | None = None
 
@@ -41,6 +40,11 @@ def _get_system_ssl_default_verify_paths() -> ssl.DefaultVerifyPaths:
         log.D("falling back to probing hard-coded paths")
         result = probe_fallback_verify_paths()
 
+    # the bundled values are only of interest for debugging
+    if not is_debug():
+        return result
+
+    orig_paths = _orig_get_default_verify_paths()
     if result != orig_paths:
         log.D(
             "get_default_verify_paths() values differ between bundled and system libssl"
@@ -69,33 +73,41 @@ def to_ssl_paths(parts: tuple[str, str, str, str]) -> ssl.DefaultVerifyPaths | N
 
 
 def _decode_fsdefault_or_none(val: int | None) -> str:
-    if val is None:
+    if not val:
         return ""
 
-    s = ctypes.c_char_p(val)
-    if s.value is None:
-        return ""
+    return os.fsdecode(ctypes.string_at(val))
 
-    return s.value.decode(sys.getfilesystemencoding())
 
+_system_libcrypto: ctypes.CDLL | None = None
 
-def _query_linux_system_ssl_default_cert_paths(
-    soname: str | None = None,
-) -> tuple[str, str, str, str] | None:
-    if soname is None:
-        # check libcrypto instead of libssl, because if the system libssl is
-        # newer than the bundled one, the system libssl will depend on the
-        # bundled libcrypto that may lack newer ELF symbol version(s). The
-        # functions actually reside in libcrypto, after all.
-        for soname in ("libcrypto.so", "libcrypto.so.3", "libcrypto.so.1.1"):
-            try:
-                return _query_linux_system_ssl_default_cert_paths(soname)
-            except OSError as e:
-                log.D(f"soname {soname} not working: {e}")
-                continue
 
-        return None
+def _get_system_libcrypto() -> ctypes.CDLL | None:
+    global _system_libcrypto
+
+    if _system_libcrypto is not None:
+        return _system_libcrypto
+
+    # check libcrypto instead of libssl, because if the system libssl is
+    # newer than the bundled one, the system libssl will depend on the
+    # bundled libcrypto that may lack newer ELF symbol version(s). The
+    # functions actually reside in libcrypto, after all.
+    #
+    # the bare libcrypto.so must come first: the bundled libcrypto is already
+    # loaded under a versioned soname, and dlopen would hand that back to us
+    # instead of the system library.
+    for soname in ("libcrypto.so", "libcrypto.so.3", "libcrypto.so.1.1"):
+        try:
+            _system_libcrypto = _open_libcrypto(soname)
+            return _system_libcrypto
+        except OSError as e:
+            log.D(f"soname {soname} not working: {e}")
+            continue
+
+    return None
+
 
+def _open_libcrypto(soname: str) -> ctypes.CDLL:
     # dlopen-ing the bare soname will get us the system library
     lib = ctypes.CDLL(soname)
     lib.X509_get_default_cert_file_env.restype = ctypes.c_void_p
@@ -103,6 +115,17 @@ def _query_linux_system_ssl_default_cert_paths(
     lib.X509_get_default_cert_dir_env.restype = ctypes.c_void_p
     lib.X509_get_default_cert_dir.restype = ctypes.c_void_p
 
+    log.D(f"using system libcrypto {soname}")
+    return lib
+
+
+def _query_linux_system_ssl_default_cert_paths(
+    soname: str | None = None,
+) -> tuple[str, str, str, str] | None:
+    lib = _get_system_libcrypto() if soname is None else _open_libcrypto(soname)
+    if lib is None:
+        return None
+
     result = (
         _decode_fsdefault_or_none(lib.X509_get_default_cert_file_env()),
         _decode_fsdefault_or_none(lib.X509_get_default_cert_file()),
@@ -110,7 +133,6 @@ def _query_linux_system_ssl_default_cert_paths(
         _decode_fsdefault_or_none(lib.X509_get_default_cert_dir()),
     )
 
-    log.D(f"got defaults from system libcrypto {soname}")
     log.D(f"X509_get_default_cert_file_env() = {result[0]}")
     log.D(f"X509_get_default_cert_file() = {result[1]}")
     log.D(f"X509_get_default_cert_dir_env() = {result[2]}")
@@ -124,14 +146,14 @@ class WellKnownCALocation(NamedTuple):
     capath: str
 
 
-WELL_KNOWN_CA_LOCATIONS: Final[list[WellKnownCALocation]] = [
+WELL_KNOWN_CA_LOCATIONS: Final[tuple[WellKnownCALocation, ...]] = (
     # Debian-based distros
     WellKnownCALocation("/usr/lib/ssl/cert.pem", "/usr/lib/ssl/certs"),
     # RPM-based distros
     WellKnownCALocation("/etc/pki/tls/cert.pem", "/etc/pki/tls/certs"),
     # Most others
     WellKnownCALocation("/etc/ssl/cert.pem", "/etc/ssl/certs"),
-]
+)
 
 
 def probe_fallback_verify_paths() -> ssl.DefaultVerifyPaths:
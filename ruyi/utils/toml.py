@@ -6,6 +6,10 @@ import tomlkit
 from tomlkit.container import Container
 from tomlkit.items import Array, InlineTable, Item, Table, Trivia
 
+# tomlkit never mutates whitespace items after insertion, so a single
+# instance can be shared by all the inline tables we emit
+_SPACE_WS = tomlkit.ws(" ")
+
 
 def with_indent(item: Item, spaces: int = 2) -> Item:
     item.indent(spaces)
@@ -26,7 +30,7 @@ class InlineTableWithSpaces(InlineTable, AbstractContextManager[InlineTable]):
         super().__init__(value, trivia, new)
 
     def __enter__(self) -> InlineTable:
-        self.add(tomlkit.ws(" "))
+        self.append(None, _SPACE_WS)
         return self
 
     def __exit__(
@@ -35,28 +39,24 @@ class InlineTableWithSpaces(InlineTable, AbstractContextManager[InlineTable]):
         exc_value: BaseException | None,
         traceback: TracebackType | None,
     ) -> bool | None:
-        self.add(tomlkit.ws(" "))
+        self.append(None, _SPACE_WS)
         return None
 
 
-def _into_item(x: Item | str) -> Item:
-    if isinstance(x, Item):
-        return x
-    return tomlkit.string(x)
-
-
 def str_array(
     args: Iterable[Item | str],
     *,
     multiline: bool = False,
     indent: int = 2,
 ) -> Array:
-    items = [_into_item(i).indent(indent) for i in args]
+    string = tomlkit.string
+    items = [(i if isinstance(i, Item) else string(i)).indent(indent) for i in args]
     return Array(items, Trivia(), multiline=multiline)
 
 
 def sorted_table(x: dict[str, str]) -> Table:
     y = tomlkit.table()
-    for k in sorted(x.keys()):
-        y.add(k, x[k])
+    add = y.add
+    for k in sorted(x):
+        add(k, x[k])
     return y
@@ -1,7 +1,5 @@
-from urllib import parse
+from urllib.parse import urljoin
 
 
 def urljoin_for_sure(base: str, url: str) -> str:
-    if base.endswith("/"):
-        return parse.urljoin(base, url)
-    return parse.urljoin(base + "/", url)
+    return urljoin(base if base.endswith("/") else base + "/", url)
@@ -1,9 +1,10 @@
 import importlib.metadata
+import re
 from typing import Final, TYPE_CHECKING
 
-import packaging.version
-
 if TYPE_CHECKING:
+    import packaging.version
+
     # pyright only works with semver 3.x
     from semver.version import Version
 else:
@@ -26,7 +27,7 @@ PYPI_PRERELEASE_KINDS_MAP: Final = {
 
 
 # based on https://python-semver.readthedocs.io/en/3.0.2/advanced/convert-pypi-to-semver.html
-def convert2semver(ver: packaging.version.Version) -> Version:
+def convert2semver(ver: "packaging.version.Version") -> Version:
     if ver.epoch:
         raise ValueError("Can't convert an epoch to semver")
     if ver.post:
@@ -41,8 +42,20 @@ def convert2semver(ver: packaging.version.Version) -> Version:
     return Version(maj, min, pat, prerelease=pre, build=ver.dev)
 
 
+# plain release versions are spelled the same in PyPI and semver styles
+_SIMPLE_RELEASE_VERSION_RE: Final = re.compile(r"^(\d+)\.(\d+)\.(\d+)$")
+
+
 def init_pkg_semver() -> Version:
-    pkg_pypi_ver = packaging.version.Version(importlib.metadata.version("ruyi"))
+    pkg_ver_str = importlib.metadata.version("ruyi")
+    if m := _SIMPLE_RELEASE_VERSION_RE.match(pkg_ver_str):
+        return Version(int(m[1]), int(m[2]), int(m[3]))
+
+    # only import packaging when actually needed, as this is on the startup
+    # path of every ruyi invocation
+    import packaging.version
+
+    pkg_pypi_ver = packaging.version.Version(pkg_ver_str)
     # log.D(f"PyPI-style version of ruyi: {pkg_pypi_ver}")
     return convert2semver(pkg_pypi_ver)
 
@@ -35,7 +35,10 @@ def get_pygit2_src_uri(tag: str) -> tuple[str, str]:
 def log(s: str, fgcolor: int = 32, group: bool = False) -> None:
     # we cannot import rich because this script is executed before
     # `poetry install` in the dist build process
-    print(f"\x1b[1;{fgcolor}m{s}\x1b[m", file=sys.stderr, flush=True)
+    # emit the whole line with one write, so it does not get interleaved
+    # with the build tools' output in CI logs
+    sys.stderr.write(f"\x1b[1;{fgcolor}m{s}\x1b[m\n")
+    sys.stderr.flush()
     if group:
         begin_group(s)
 
@@ -85,22 +88,17 @@ def main() -> None:
 
 
 def ensure_dir(d: str) -> None:
-    try:
-        os.mkdir(d)
-    except FileExistsError:
-        pass
+    os.makedirs(d, exist_ok=True)
 
 
 def ensure_pygit2_wheel(ver: str, workdir: str, cache_root: str, cache_rev: int) -> str:
     cache_key = get_cache_key("pygit2", ver, cache_rev)
     cache_dir = os.path.join(cache_root, cache_key)
     try:
-        wheel_file = [
-            i for i in os.listdir(cache_dir) if os.path.splitext(i)[1] == ".whl"
-        ][0]
+        wheel_file = find_built_wheel_name_in(cache_dir)
         wheel_path = os.path.join(cache_dir, wheel_file)
         log(f"found cached pygit2 (cache rev {cache_rev}) at {wheel_path}")
-    except (FileNotFoundError, IndexError):
+    except FileNotFoundError:
         log(f"cached pygit2 (cache rev {cache_rev}) not found, building")
         wheel_path = build_pygit2(ver, workdir)
 
@@ -108,7 +106,12 @@ def ensure_pygit2_wheel(ver: str, workdir: str, cache_root: str, cache_rev: int)
         ensure_dir(cache_dir)
 
         dest_path = os.path.join(cache_dir, os.path.basename(wheel_path))
-        shutil.copyfile(wheel_path, dest_path)
+        try:
+            # wheels are never modified once built, so sharing the inode is
+            # fine, and saves a copy when the cache is on the same filesystem
+            os.link(wheel_path, dest_path)
+        except OSError:
+            shutil.copyfile(wheel_path, dest_path)
 
     return wheel_path
 
@@ -188,7 +191,11 @@ def get_pygit2_wheel_build_env(pygit2_dir: str) -> dict[str, str]:
 
 
 def find_built_wheel_name_in(path: str) -> str:
-    return [x for x in os.listdir(path) if os.path.splitext(x)[1] == ".whl"][0]
+    with os.scandir(path) as it:
+        for e in it:
+            if e.name.endswith(".whl") and e.is_file():
+                return e.name
+    raise FileNotFoundError(f"no wheel found in {path}")
 
 
 def get_cache_key(pkg_name: str, version: str, cache_rev: int) -> str:
@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+import hashlib
+import importlib.metadata
 import os
 import pathlib
 import platform
@@ -27,6 +29,9 @@ INFO = Console(stderr=True, style="bold green", force_terminal=True, highlight=F
 
 LGPL_MODULES: Iterable[str] = ()
 
+# name of the Nuitka cache directory under RUYI_DIST_CACHE_DIR
+NUITKA_CACHE_DIR_NAME = "nuitka-cache"
+
 
 def make_canonicalized_host_for_progcache() -> str:
     # Similar to ruyipkg/host.py but in the format of f"{os}-{arch}"
@@ -64,17 +69,27 @@ def main() -> None:
     cache_root = os.environ["RUYI_DIST_CACHE_DIR"]
     ensure_dir(cache_root)
 
-    cache_key = get_cache_key(vers["git_commit"])
+    cache_key = get_cache_key()
+    INFO.print(f"Build cache key          : [cyan]{cache_key}")
     cached_output_dir = pathlib.Path(cache_root) / cache_key
     cached_output_file = cached_output_dir / exe_name
     try:
         shutil.copyfile(cached_output_file, output_file)
         os.chmod(output_file, 0o755)
         INFO.print(f"cache hit at [cyan]{cached_output_file}[/], skipping build")
+        # entries are reused across commits, so age them by last use
+        (cached_output_dir / "timestamp").write_text(f"{epoch}\n")
         return
     except FileNotFoundError:
         pass
 
+    if "NUITKA_CACHE_DIR" not in os.environ:
+        # keep Nuitka's own caches (bytecode, DLL dependencies, downloaded
+        # tools) alongside ours, so they are persisted across CI runs too
+        nuitka_cache_dir = os.path.join(cache_root, NUITKA_CACHE_DIR_NAME)
+        prepare_nuitka_cache_dir(nuitka_cache_dir, epoch)
+        os.environ["NUITKA_CACHE_DIR"] = nuitka_cache_dir
+
     ext_outdir = os.path.join(build_root, "_exts")
     ensure_dir(ext_outdir)
     add_pythonpath(ext_outdir)
@@ -136,14 +151,69 @@ def end_group() -> None:
 
 
 def ensure_dir(d: str | pathlib.Path) -> None:
+    os.makedirs(d, exist_ok=True)
+
+
+# Inputs that affect the Nuitka output, relative to project root. Keying the
+# cache on their content instead of the Git commit allows reuse of the built
+# executable across commits touching only docs or tests. The build image and
+# workflow definitions are included, so that toolchain bumps are not masked.
+CACHE_KEY_INPUT_FILES = (
+    ".github/workflows/dist.yml",
+    "poetry.lock",
+    "pyproject.toml",
+    "resources/ruyi.ico",
+    "scripts/_image_tag_base.sh",
+    "scripts/build-pygit2.py",
+    "scripts/dist-inner.py",
+    "scripts/dist.ps1",
+    "scripts/dist.sh",
+)
+CACHE_KEY_INPUT_DIRS = ("ruyi", "scripts/dist-image", "scripts/patches")
+
+
+def get_cache_key() -> str:
+    h = hashlib.blake2b(digest_size=16)
+    # the interpreter Nuitka compiles against is part of the toolchain too
+    h.update(f"{sys.version}\0{platform.machine()}\0".encode("utf-8"))
+    for path in sorted(iter_cache_key_input_files()):
+        h.update(path.encode("utf-8"))
+        h.update(b"\0")
+        h.update(hashlib.blake2b(pathlib.Path(path).read_bytes()).digest())
+    return f"ruyi-c{h.hexdigest()}"
+
+
+def iter_cache_key_input_files() -> Iterable[str]:
+    yield from CACHE_KEY_INPUT_FILES
+    for d in CACHE_KEY_INPUT_DIRS:
+        for root, dirs, files in os.walk(d):
+            dirs[:] = [x for x in dirs if x != "__pycache__"]
+            for f in files:
+                if not f.endswith(".pyc"):
+                    # use forward slashes so the key is the same on Windows
+                    yield pathlib.PurePath(root, f).as_posix()
+
+
+def prepare_nuitka_cache_dir(path: str, epoch: int) -> None:
+    # Nuitka's caches are only valid for the same toolchain, and are never
+    # trimmed by Nuitka itself, so start afresh whenever the toolchain changes
+    toolchain = "\n".join(
+        (sys.version, platform.machine(), importlib.metadata.version("nuitka"))
+    )
+    stamp = pathlib.Path(path) / "toolchain"
     try:
-        os.mkdir(d)
-    except FileExistsError:
-        pass
+        is_stale = stamp.read_text(encoding="utf-8") != toolchain
+    except FileNotFoundError:
+        is_stale = True
 
+    if is_stale:
+        INFO.print(f"resetting Nuitka cache [cyan]{path}[/] for the current toolchain")
+        shutil.rmtree(path, ignore_errors=True)
+        ensure_dir(path)
+        stamp.write_text(toolchain, encoding="utf-8")
 
-def get_cache_key(git_commit: str) -> str:
-    return f"ruyi-g{git_commit}"
+    # also let it expire with the rest of the cache if left unused
+    (pathlib.Path(path) / "timestamp").write_text(f"{epoch}\n")
 
 
 def delete_cached_files_older_than_days(root: str, days: int, epoch: int) -> None:
@@ -154,22 +224,23 @@ def delete_cached_files_older_than_days(root: str, days: int, epoch: int) -> Non
         f"purging cache contents older than [cyan]{days}[/] days from [cyan]now={epoch_str}"
     )
 
-    root_path = pathlib.Path(root)
-    dirs_to_remove: list[tuple[pathlib.Path, int | None]] = []
-    for f in root_path.iterdir():
-        if f.name.startswith("pygit2"):
-            INFO.print(f"ignoring library artifact cache [cyan]{f}")
-            continue
+    dirs_to_remove: list[tuple[str, int | None]] = []
+    with os.scandir(root) as it:
+        for e in it:
+            if e.name.startswith("pygit2"):
+                INFO.print(f"ignoring library artifact cache [cyan]{e.path}")
+                continue
 
-        ts: int | None
-        try:
-            ts = int((f / "timestamp").read_text().strip(), 10)
-        except (FileNotFoundError, ValueError):
-            dirs_to_remove.append((f, None))
-            continue
+            ts: int | None
+            try:
+                with open(os.path.join(e.path, "timestamp"), "rb") as fp:
+                    ts = int(fp.read().strip(), 10)
+            except (FileNotFoundError, ValueError):
+                dirs_to_remove.append((e.path, None))
+                continue
 
-        if ts - epoch >= max_ts_delta:
-            dirs_to_remove.append((f, ts))
+            if epoch - ts >= max_ts_delta:
+                dirs_to_remove.append((e.path, ts))
 
     for f, ts in dirs_to_remove:
         if ts is None:
@@ -184,15 +255,16 @@ def delete_cached_files_older_than_days(root: str, days: int, epoch: int) -> Non
         shutil.rmtree(f)
 
 
+NUITKA_ARGV_PREFIX = (
+    # https://stackoverflow.com/questions/64761870/python-subprocess-doesnt-inherit-virtual-environment
+    sys.executable,  # "python",
+    "-m",
+    "nuitka",
+)
+
+
 def call_nuitka(*args: str) -> None:
-    nuitka_args = [
-        # https://stackoverflow.com/questions/64761870/python-subprocess-doesnt-inherit-virtual-environment
-        sys.executable,  # "python",
-        "-m",
-        "nuitka",
-    ]
-    nuitka_args.extend(args)
-    subprocess.run(nuitka_args, check=True)
+    subprocess.run(NUITKA_ARGV_PREFIX + args, check=True)
 
 
 def add_pythonpath(path: str) -> None:
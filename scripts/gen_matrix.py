@@ -3,7 +3,6 @@
 import os
 import json
 import pathlib
-import pprint
 import sys
 from typing import NamedTuple, TypedDict
 
@@ -133,11 +132,13 @@ def main() -> None:
     log("resulting matrix:")
     for entry in result_includes:
         print(f"::group::Job {entry['job_name']}")
-        pprint.pprint(entry)
+        print(json.dumps(entry, indent=2))
         print("::endgroup::")
 
     outfile = pathlib.Path(os.environ["GITHUB_OUTPUT"])
-    outfile.write_text(f"matrix={json.dumps(matrix)}\n")
+    # whitespace is insignificant to GitHub Actions
+    matrix_json = json.dumps(matrix, separators=(",", ":"))
+    outfile.write_text(f"matrix={matrix_json}\n")
 
 
 if __name__ == "__main__":
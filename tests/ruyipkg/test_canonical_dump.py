@@ -0,0 +1,96 @@
+from ruyi.ruyipkg.canonical_dump import dump_canonical_package_manifest_toml
+from ruyi.ruyipkg.pkg_manifest import PackageManifestType
+
+
+def test_dump_canonical_package_manifest_toml() -> None:
+    x: PackageManifestType = {
+        "format": "v1",
+        "kind": ["binary", "provisionable", "toolchain"],
+        "metadata": {
+            "desc": "Test toolchain",
+            "vendor": {"name": "Test Vendor", "eula": None},
+        },
+        "distfiles": [
+            {
+                "name": "foo.tar.zst",
+                "size": 1234,
+                "urls": [
+                    "https://example.com/foo.tar.zst",
+                    "https://mirror.example.com/foo.tar.zst",
+                ],
+                "checksums": {"sha512": "bbbb", "sha256": "aaaa"},
+            },
+            {
+                "name": "bar.img",
+                "size": 5678,
+                "restrict": ["mirror"],
+                "fetch_restriction": {"msgid": "foo", "params": {"z": "1", "a": "2"}},
+                "checksums": {"sha256": "cccc"},
+            },
+        ],
+        "binary": [{"host": "x86_64", "distfiles": ["foo.tar.zst"]}],
+        "provisionable": {"strategy": "dd-v1", "partition_map": {"disk": "bar.img"}},
+        "toolchain": {
+            "target": "riscv64-plct-linux-gnu",
+            "flavors": ["foo"],
+            "components": [
+                {"name": "gcc", "version": "14.1.0"},
+                {"name": "binutils", "version": "2.42"},
+            ],
+        },
+    }
+
+    expected = """\
+format = "v1"
+
+[metadata]
+desc = "Test toolchain"
+vendor = { name = "Test Vendor", eula = "" }
+
+[[distfiles]]
+name = "foo.tar.zst"
+size = 1234
+urls = [
+    "https://example.com/foo.tar.zst",
+    "https://mirror.example.com/foo.tar.zst",
+]
+
+[distfiles.checksums]
+sha256 = "aaaa"
+sha512 = "bbbb"
+
+[[distfiles]]
+name = "bar.img"
+size = 5678
+restrict = ["mirror"]
+
+[distfiles.fetch_restriction]
+msgid = "foo"
+
+[distfiles.fetch_restriction.params]
+a = "2"
+z = "1"
+
+[distfiles.checksums]
+sha256 = "cccc"
+
+[[binary]]
+host = "x86_64"
+distfiles = ["foo.tar.zst"]
+
+[provisionable]
+strategy = "dd-v1"
+
+[provisionable.partition_map]
+disk = "bar.img"
+
+[toolchain]
+target = "riscv64-plct-linux-gnu"
+flavors = ["foo"]
+components = [
+    { name = "binutils", version = "2.42" },
+    { name = "gcc", version = "14.1.0" },
+]
+"""
+
+    assert dump_canonical_package_manifest_toml(x).as_string() == expected
@@ -0,0 +1,60 @@
+import glob
+import platform
+import sys
+
+import pytest
+
+from ruyi.telemetry.node_info import probe_for_libc, probe_for_riscv_machine_info
+
+_CPUINFO_SAMPLE = """processor\t: 0
+hart\t\t: 2
+isa\t\t: rv64imafdcv_zicbom_zicboz_zicntr_zicsr_zifencei_zihpm
+mmu\t\t: sv39
+uarch\t\t: thead,c908
+mvendorid\t: 0x5b7
+marchid\t\t: 0x0
+mimpid\t\t: 0x0
+
+processor\t: 1
+hart\t\t: 0
+isa\t\t: rv64imafdcv_zicbom_zicboz_zicntr_zicsr_zifencei_zihpm
+mmu\t\t: sv39
+uarch\t\t: thead,c908
+mvendorid\t: 0x5b7
+marchid\t\t: 0x0
+mimpid\t\t: 0x0
+
+"""
+
+
+def test_probe_for_riscv_machine_info() -> None:
+    info = probe_for_riscv_machine_info("Test Board", _CPUINFO_SAMPLE)
+    assert info == {
+        "model_name": "Test Board",
+        "cpu_count": 2,
+        "isa": "rv64imafdcv_zicbom_zicboz_zicntr_zicsr_zifencei_zihpm",
+        "mmu": "sv39",
+        "uarch": "thead,c908",
+        "uarch_csr": "5b7:0:0",
+    }
+
+
+def test_probe_for_riscv_machine_info_malformed() -> None:
+    cpuinfo = "processor\t: 0\ngarbage\nuarch\t\t: \nmvendorid\t: 123\n"
+    info = probe_for_riscv_machine_info("Test Board", cpuinfo)
+    assert info is not None
+    assert info["cpu_count"] == 1
+    assert info["isa"] == "unknown"
+    assert info["uarch"] == ""
+    assert info["uarch_csr"] == "unknown"
+
+
+def test_probe_for_libc_unknown(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sys, "platform", "darwin")
+    monkeypatch.setattr(platform, "libc_ver", lambda: ("", ""))
+    monkeypatch.setattr(glob, "glob", lambda _: [])
+    probe_for_libc.cache_clear()
+    try:
+        assert probe_for_libc() == ("unknown", "unknown")
+    finally:
+        probe_for_libc.cache_clear()
@@ -48,3 +48,11 @@ def test_match_lang_code() -> None:
     # fallback to the lexicographically first one
     assert match_lang_code("ru", ["ga", "es_ES"]) == "es_ES"
     assert match_lang_code("ru", ["es_ES", "ga"]) == "es_ES"
+
+
+def test_match_lang_code_container_types() -> None:
+    avail = ["en", "en_IE", "zh_CN"]
+    for x in (avail, set(avail), frozenset(avail), {k: 1 for k in avail}.keys()):
+        assert match_lang_code("ga", x) == "en_IE"
+        assert match_lang_code("zh", x) == "zh_CN"
+        assert match_lang_code("en_IE", x) == "en_IE"
@@ -0,0 +1,62 @@
+import io
+
+from ruyi.utils.porcelain import (
+    PORCELAIN_BATCH_THRESHOLD,
+    PorcelainEntity,
+    PorcelainEntityType,
+    PorcelainOutput,
+)
+
+
+class _TestEntity(PorcelainEntity):
+    msg: str
+
+
+def test_porcelain_output_emit() -> None:
+    buf = io.BytesIO()
+    with PorcelainOutput(buf) as po:
+        po.emit({"ty": PorcelainEntityType.LogV1})
+        po.emit({"ty": PorcelainEntityType.NewsItemV1})
+
+    assert buf.getvalue() == b'{"ty":"log-v1"}\n{"ty":"newsitem-v1"}\n'
+
+
+def test_porcelain_output_emit_non_ascii() -> None:
+    buf = io.BytesIO()
+    with PorcelainOutput(buf) as po:
+        obj: _TestEntity = {"ty": PorcelainEntityType.LogV1, "msg": "你好"}
+        po.emit(obj)
+
+    assert buf.getvalue() == '{"ty":"log-v1","msg":"你好"}\n'.encode("utf-8")
+
+
+def test_porcelain_output_batching() -> None:
+    buf = io.BytesIO()
+    po = PorcelainOutput(buf)
+
+    # emitted immediately outside of a context
+    po.emit({"ty": PorcelainEntityType.LogV1})
+    assert buf.getvalue() == b'{"ty":"log-v1"}\n'
+
+    with po:
+        po.emit({"ty": PorcelainEntityType.NewsItemV1})
+        # batched until the context exits
+        assert buf.getvalue() == b'{"ty":"log-v1"}\n'
+
+    assert buf.getvalue() == b'{"ty":"log-v1"}\n{"ty":"newsitem-v1"}\n'
+
+
+def test_porcelain_output_batching_threshold() -> None:
+    buf = io.BytesIO()
+    with PorcelainOutput(buf) as po:
+        obj: _TestEntity = {"ty": PorcelainEntityType.LogV1, "msg": "x" * 1024}
+        line_len = len(b'{"ty":"log-v1","msg":""}\n') + 1024
+        n = PORCELAIN_BATCH_THRESHOLD // line_len + 1
+        for _ in range(n):
+            po.emit(obj)
+        assert len(buf.getvalue()) == n * line_len
+
+        po.emit(obj)
+        assert len(buf.getvalue()) == n * line_len
+
+    assert len(buf.getvalue()) == (n + 1) * line_len
@@ -0,0 +1,22 @@
+import pathlib
+
+import pytest
+
+from ruyi.utils.xdg_basedir import XDGBaseDir
+
+
+def test_xdg_dirs_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CONFIG_DIRS", "/a:/b")
+    monkeypatch.setenv("XDG_DATA_DIRS", "/c")
+    d = XDGBaseDir("foo")
+    assert d.config_dirs == (pathlib.Path("/a"), pathlib.Path("/b"))
+    assert d.data_dirs == (pathlib.Path("/c"),)
+    assert d.app_data_dirs[1:] == (pathlib.Path("/c/foo"),)
+
+
+def test_xdg_dirs_empty_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CONFIG_DIRS", "")
+    monkeypatch.delenv("XDG_DATA_DIRS", raising=False)
+    d = XDGBaseDir("foo")
+    assert d.config_dirs == (pathlib.Path("/etc/xdg"),)
+    assert d.data_dirs == (pathlib.Path("/usr/local/share"), pathlib.Path("/usr/share"))